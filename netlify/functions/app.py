@@ -1,10 +1,9 @@
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
+import asyncio
 import sys
 import os
-from langdetect import detect
 from werkzeug.utils import secure_filename
-import PyPDF2
 from io import BytesIO
 
 # Add project root to Python path
@@ -12,12 +11,15 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 # Import our utility functions
 from utils.news_utils import (
-    extract_article, 
-    translate_to_english, 
+    extract_article,
+    translate_to_english,
     analyze_bias,
-    sentence_tone_breakdown, 
+    sentence_tone_breakdown,
     get_source_reliability_score,
-    detect_political_leaning
+    detect_political_leaning,
+    detect_language,
+    split_sentences,
+    build_blob
 )
 
 app = Flask(__name__)
@@ -27,9 +29,15 @@ CORS(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 ALLOWED_EXTENSIONS = {'txt', 'pdf'}
+MAX_TEXT_LENGTH = 200_000  # characters of extracted text worth analyzing
+MAX_ANALYSIS_CHARS = 10_000  # characters fed to the sentiment analyzers
 
-# Create uploads directory if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Create uploads directory if it doesn't exist; serverless filesystems can
+# be read-only and uploads are processed in memory anyway
+try:
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+except OSError:
+    pass
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -39,73 +47,94 @@ def index():
     """Serve the main page"""
     return render_template('index.html')
 
+async def _run_pipeline(text, title, lang, url=None):
+    """Run the full analysis pipeline and return the response payload
+
+    Shared by /api/analyze and /api/upload so both endpoints produce the
+    same result shape. Returns a dict with an "error" key on failure.
+    """
+    translated_text = translate_to_english(text, lang) if lang != "en" else text
+
+    # Perform analysis - tokenize and split once, share across functions.
+    # TextBlob's tagger scales linearly with tokens and the opening of
+    # an article determines its bias label, so cap what the analyzers see.
+    snippet = translated_text[:MAX_ANALYSIS_CHARS]
+    blob = await asyncio.to_thread(build_blob, snippet)
+    sentences = split_sentences(snippet)
+
+    bias_data = await asyncio.to_thread(analyze_bias, snippet, blob)
+    if "error" in bias_data:
+        return {"error": f"Bias analysis failed: {bias_data['error']}"}
+
+    political_scores = await asyncio.to_thread(detect_political_leaning, snippet, sentences)
+    tone_data = await asyncio.to_thread(sentence_tone_breakdown, snippet, sentences)
+
+    # Get source reliability for URL-based analysis
+    if url:
+        score_info = get_source_reliability_score(url)
+    else:
+        score_info = {"score": "N/A", "label": "Manual Input"}
+
+    return {
+        "success": True,
+        "title": title,
+        "language": lang,
+        "text": text,
+        "translated_text": translated_text if lang != "en" else None,
+        "analyzed_chars": len(snippet),
+        "bias_analysis": bias_data,
+        "tone_breakdown": tone_data,
+        "source_reliability": score_info,
+        "political_leaning": political_scores,
+    }
+
 @app.route("/api/analyze", methods=["POST"])
-def analyze():
-    """Main analysis endpoint"""
+async def analyze():
+    """Main analysis endpoint
+
+    The view is async with the blocking pieces (article fetch, TextBlob
+    tagging) pushed onto worker threads, so under an ASGI server the
+    event loop stays free while a slow news site responds.
+    """
     try:
         data = request.get_json()
-        
+
         # Handle manual text input
         if data.get("manual"):
             text = data.get("text", "")
             title = data.get("title", "Untitled")
-            
+            url = None
+
             if not text.strip():
                 return jsonify({"error": "No text provided"}), 400
-                
-            try:
-                lang = detect(text)
-            except:
-                lang = "en"
-                
-            translated_text = translate_to_english(text, lang) if lang != "en" else text
-            
+
+            lang = await asyncio.to_thread(detect_language, text)
+
         else:
             # Handle URL-based analysis
             url = data.get("url")
             if not url:
                 return jsonify({"error": "URL is required"}), 400
 
-            article_data = extract_article(url)
+            article_data = await asyncio.to_thread(extract_article, url)
             if "error" in article_data:
                 return jsonify({"error": f"Article extraction failed: {article_data['error']}"}), 500
 
             text = article_data["text"]
             title = article_data["title"]
             lang = article_data["language"]
-            translated_text = translate_to_english(text, lang)
 
-        # Perform analysis
-        bias_data = analyze_bias(translated_text)
-        if "error" in bias_data:
-            return jsonify({"error": f"Bias analysis failed: {bias_data['error']}"}), 500
-            
-        political_scores = detect_political_leaning(translated_text)
-        tone_data = sentence_tone_breakdown(translated_text)
-        
-        # Get source reliability for URL-based analysis
-        if not data.get("manual"):
-            score_info = get_source_reliability_score(data.get("url"))
-        else:
-            score_info = {"score": "N/A", "label": "Manual Input"}
-
-        return jsonify({
-            "success": True,
-            "title": title,
-            "language": lang,
-            "text": text,
-            "translated_text": translated_text if lang != "en" else None,
-            "bias_analysis": bias_data,
-            "tone_breakdown": tone_data,
-            "source_reliability": score_info,
-            "political_leaning": political_scores,
-        })
+        result = await _run_pipeline(text, title, lang, url=url)
+        if "error" in result:
+            return jsonify(result), 500
+
+        return jsonify(result)
 
     except Exception as e:
         return jsonify({"error": f"Analysis failed: {str(e)}"}), 500
 
 @app.route("/api/upload", methods=["POST"])
-def upload_file():
+async def upload_file():
     """Handle file upload"""
     try:
         if 'file' not in request.files:
@@ -124,13 +153,33 @@ def upload_file():
             if filename.endswith('.txt'):
                 text = file_content.decode('utf-8')
             elif filename.endswith('.pdf'):
-                pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
+                # Imported here so .txt uploads and analyze requests
+                # never pay pypdf's import cost
+                from pypdf import PdfReader
+                pdf_reader = PdfReader(BytesIO(file_content))
+                parts = []
+                total = 0
                 for page in pdf_reader.pages:
-                    text += page.extract_text()
+                    page_text = page.extract_text() or ''
+                    parts.append(page_text)
+                    total += len(page_text)
+                    if total > MAX_TEXT_LENGTH:
+                        break  # enough text for analysis, skip remaining pages
+                text = ''.join(parts)
             
             if not text.strip():
                 return jsonify({"error": "Could not extract text from file"}), 400
-                
+
+            # Optionally analyze in-process so the client doesn't have to
+            # re-POST the extracted text to /api/analyze
+            if request.args.get("analyze") == "true":
+                lang = await asyncio.to_thread(detect_language, text)
+                result = await _run_pipeline(text, filename, lang)
+                if "error" in result:
+                    return jsonify(result), 500
+                result["filename"] = filename
+                return jsonify(result)
+
             return jsonify({
                 "success": True,
                 "text": text,
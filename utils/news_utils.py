@@ -1,22 +1,175 @@
 import requests
-from bs4 import BeautifulSoup
-from langdetect import detect
-from textblob import TextBlob
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import functools
+import hashlib
+import os
 import re
+import threading
 from urllib.parse import urlparse
 import time
 
+class _TTLCache:
+    """Small thread-safe cache with a max size and per-entry expiry"""
+    def __init__(self, maxsize=512, ttl=900):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.time() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                # Drop the oldest entry to stay bounded
+                oldest = min(self._data, key=lambda k: self._data[k][1])
+                del self._data[oldest]
+            self._data[key] = (value, time.time())
+
+# Cache extracted articles for 15 minutes so re-analyzing a trending URL
+# skips the network fetch and HTML parsing entirely
+_ARTICLE_CACHE = _TTLCache(maxsize=512, ttl=900)
+
+def _normalize_url(url):
+    """Normalize a URL for cache lookups (lowercase host, drop fragment)"""
+    parsed = urlparse(url)
+    return parsed._replace(netloc=parsed.netloc.lower(), fragment='').geturl()
+
+# Only load the language profiles we actually expect to see instead of
+# langdetect's full set of 55 - this shrinks the resident n-gram tables
+# (~44MB when fully loaded) and every detect() scores fewer candidates.
+# Covers major world languages plus the Indian languages relevant here.
+_LANGDETECT_PROFILES = {
+    'en', 'es', 'ar', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko',
+    'zh-cn', 'zh-tw', 'hi', 'bn', 'ta', 'te', 'mr', 'gu', 'pa', 'ur'
+}
+
+_langdetect_patched = False
+
+def _patch_langdetect_factory():
+    """Point langdetect's init_factory at the profile subset (lazy, once)"""
+    global _langdetect_patched
+    if _langdetect_patched:
+        return
+    from langdetect import detector_factory
+    from langdetect.detector_factory import DetectorFactory
+
+    def _init_langdetect_factory():
+        if detector_factory._factory is None:
+            json_profiles = []
+            for name in sorted(os.listdir(detector_factory.PROFILES_DIRECTORY)):
+                if name not in _LANGDETECT_PROFILES:
+                    continue
+                path = os.path.join(detector_factory.PROFILES_DIRECTORY, name)
+                with open(path, 'r', encoding='utf-8') as f:
+                    json_profiles.append(f.read())
+            factory = DetectorFactory()
+            factory.load_json_profile(json_profiles)
+            detector_factory._factory = factory
+
+    detector_factory.init_factory = _init_langdetect_factory
+    DetectorFactory.seed = 0  # deterministic detection results
+    _langdetect_patched = True
+
+@functools.lru_cache(maxsize=512)
+def _detect_cached(snippet):
+    _patch_langdetect_factory()
+    from langdetect import detect
+    return detect(snippet)
+
+def detect_language(text):
+    """Detect the language of text, defaulting to English on failure
+
+    Only the first 1000 characters are scored - langdetect's n-gram cost
+    grows with text length and a snippet is plenty to identify the
+    language of an article. The result is memoized since the same text
+    flows through several functions per request.
+    """
+    try:
+        snippet = text[:1000].replace('\n', ' ')
+        return _detect_cached(snippet)
+    except:
+        return "en"
+
+# Shared HTTP session so repeated fetches reuse pooled connections
+# instead of paying a fresh TCP+TLS handshake per article
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Union selectors so title/content candidates come from one DOM traversal
+# instead of one select_one pass per selector. The individual selectors are
+# kept (in priority order) so candidates can be ranked afterwards - a union
+# query alone yields document order, which would let <title> in <head> win
+# over the article's <h1>.
+_TITLE_SELECTORS = ('h1', '.headline', '.title', '[class*="headline"]', '[class*="title"]', 'title')
+_TITLE_SELECTOR = ', '.join(_TITLE_SELECTORS)
+_CONTENT_SELECTORS = (
+    'article', '.article-content', '.content', '.post-content', '.story-body',
+    '[class*="article"]', '[class*="content"]', '[class*="story"]', '.entry-content', 'main'
+)
+_CONTENT_SELECTOR = ', '.join(_CONTENT_SELECTORS)
+
+def _select_by_priority(soup, union_selector, selectors):
+    """Yield union-query matches ranked by selector order, not document order"""
+    matches = soup.select(union_selector)
+    seen = set()
+    for selector in selectors:
+        for elem in matches:
+            if id(elem) not in seen and elem.css.match(selector):
+                seen.add(id(elem))
+                yield elem
+
+# Article pages rarely need more than this much HTML; the cap bounds peak
+# memory when a bloated page inlines megabytes of scripts and JSON
+_MAX_FETCH_BYTES = 2_000_000
+
+def _fetch_page(url):
+    """Fetch a page body, streamed and truncated at _MAX_FETCH_BYTES"""
+    with SESSION.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= _MAX_FETCH_BYTES:
+                break
+        return b''.join(chunks)
+
 def extract_article(url):
     """Extract article content from URL using web scraping"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        cache_key = _normalize_url(url)
+        cached = _ARTICLE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        content = _fetch_page(url)
+
+        # lxml parses markup in C - much faster than the stdlib html.parser
+        # on the large pages news sites serve
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content, 'lxml')
         
         # Remove script and style elements
         for script in soup(["script", "style", "nav", "footer", "aside", "header"]):
@@ -26,45 +179,20 @@ def extract_article(url):
         title = ""
         text = ""
         
-        # Extract title
-        title_selectors = [
-            'h1',
-            '.headline',
-            '.title',
-            '[class*="headline"]',
-            '[class*="title"]',
-            'title'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem and len(title_elem.get_text().strip()) > 5:
-                title = title_elem.get_text().strip()
+        # Extract title: first matching element with a plausible length
+        for title_elem in _select_by_priority(soup, _TITLE_SELECTOR, _TITLE_SELECTORS):
+            candidate = title_elem.get_text().strip()
+            if len(candidate) > 5:
+                title = candidate
                 break
-        
-        # Extract main content
-        content_selectors = [
-            'article',
-            '.article-content',
-            '.content',
-            '.post-content',
-            '.story-body',
-            '[class*="article"]',
-            '[class*="content"]',
-            '[class*="story"]',
-            '.entry-content',
-            'main'
-        ]
-        
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                # Get all paragraphs within the content
-                paragraphs = content_elem.find_all('p')
-                if paragraphs:
-                    text = ' '.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-                    if len(text) > 200:  # Only use if we got substantial content
-                        break
+
+        # Extract main content: first candidate with substantial paragraphs
+        for content_elem in _select_by_priority(soup, _CONTENT_SELECTOR, _CONTENT_SELECTORS):
+            paragraphs = content_elem.find_all('p')
+            if paragraphs:
+                text = ' '.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+                if len(text) > 200:  # Only use if we got substantial content
+                    break
         
         # Fallback: get all paragraphs from the page
         if not text or len(text) < 200:
@@ -72,8 +200,8 @@ def extract_article(url):
             text = ' '.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
         
         # Clean up text
-        text = re.sub(r'\s+', ' ', text).strip()
-        title = re.sub(r'\s+', ' ', title).strip()
+        text = _WS_RE.sub(' ', text).strip()
+        title = _WS_RE.sub(' ', title).strip()
         
         if not title:
             title = "Extracted Article"
@@ -82,18 +210,17 @@ def extract_article(url):
             return {"error": "Could not extract sufficient content from the article"}
         
         # Detect language
-        try:
-            language = detect(text)
-        except:
-            language = "en"
+        language = detect_language(text)
         
-        return {
+        result = {
             "title": title,
             "text": text,
             "language": language,
             "url": url
         }
-        
+        _ARTICLE_CACHE.set(cache_key, result)
+        return result
+
     except requests.exceptions.RequestException as e:
         return {"error": f"Failed to fetch URL: {str(e)}"}
     except Exception as e:
@@ -108,10 +235,66 @@ def translate_to_english(text, source_lang):
     # For now, we'll just return the original text with a note
     return text
 
-def analyze_bias(text):
+# Hot-path regexes, compiled once at import
+_WS_RE = re.compile(r'\s+')
+_SENT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Lexicon-based sentiment scorer for per-sentence work - unlike TextBlob
+# it does no POS tagging, so scoring a sentence is a dict lookup per token
+_VADER = SentimentIntensityAnalyzer()
+
+def _sentence_polarity(sentence):
+    """Polarity of a single sentence in [-1, 1] via the VADER lexicon"""
+    return _VADER.polarity_scores(sentence)['compound']
+
+def _subjectivity_from_tokens(tokens):
+    """Approximate subjectivity as the share of opinion-bearing words"""
+    if not tokens:
+        return 0.0
+    opinionated = sum(1 for t in tokens if t in _VADER.lexicon)
+    return min(1.0, 3.0 * opinionated / len(tokens))
+
+def split_sentences(text):
+    """Split text into cleaned sentences, shared by the analysis functions"""
+    return [s.strip() for s in _SENT_RE.split(text) if s.strip()]
+
+_TextBlob = None
+
+def build_blob(text):
+    """Construct a TextBlob, importing textblob on first use
+
+    textblob drags in NLTK at import and is a large share of cold-start
+    time, so requests that never reach the bias analyzer skip it.
+    """
+    global _TextBlob
+    if _TextBlob is None:
+        from textblob import TextBlob
+        # Warm the analyzer once: .sentiment lazily parses the pattern
+        # sentiment lexicon from disk, so trigger that here rather than
+        # inside the first user-facing request's timing
+        TextBlob('warmup').sentiment
+        _TextBlob = TextBlob
+    return _TextBlob(text)
+
+# Memoize the analyzers by content hash - they are pure functions of the
+# text, and many readers analyze the same trending article
+_ANALYSIS_CACHE = _TTLCache(maxsize=2048, ttl=3600)
+
+def _text_digest(text):
+    """Compact content key for memoizing pure text analyses"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def analyze_bias(text, blob=None):
     """Analyze bias in text using TextBlob and custom rules"""
     try:
-        blob = TextBlob(text)
+        cache_key = ('bias', _text_digest(text))
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if blob is None:
+            blob = build_blob(text)
         polarity = blob.sentiment.polarity
         subjectivity = blob.sentiment.subjectivity
         
@@ -139,51 +322,74 @@ def analyze_bias(text):
         # Add confidence score
         confidence = min(1.0, abs(polarity) + subjectivity)
         
-        return {
+        result = {
             "bias": bias_label,
             "polarity": round(polarity, 3),
             "subjectivity": round(subjectivity, 3),
             "confidence": round(confidence, 3)
         }
+        _ANALYSIS_CACHE.set(cache_key, result)
+        return result
     except Exception as e:
         return {"error": str(e)}
 
-def sentence_tone_breakdown(text):
+# Enhanced political keywords
+political_keywords = {
+    "parties": ["BJP", "Congress", "AAP", "Aam Aadmi Party", "NDA", "UPA", "RSS"],
+    "leaders": ["Modi", "Narendra Modi", "Rahul Gandhi", "Arvind Kejriwal", "Sonia Gandhi"],
+    "terms": ["government", "opposition", "politics", "election", "democracy", "parliament"]
+}
+
+# Enhanced political entity mapping
+political_entities = {
+    "BJP": {
+        "keywords": ["BJP", "Bharatiya Janata Party", "Modi", "Narendra Modi", "NDA", "RSS", "Amit Shah"],
+        "context_words": ["hindu", "nationalism", "development", "digital india"]
+    },
+    "Congress": {
+        "keywords": ["Congress", "Indian National Congress", "Rahul Gandhi", "Sonia Gandhi", "UPA", "Priyanka Gandhi"],
+        "context_words": ["secular", "inclusive", "welfare", "minority"]
+    },
+    "AAP": {
+        "keywords": ["AAP", "Aam Aadmi Party", "Arvind Kejriwal", "Manish Sisodia"],
+        "context_words": ["corruption", "common man", "education", "healthcare"]
+    }
+}
+
+def _compile_keyword_regex(keywords):
+    """Build one regex matching any keyword, longest alternatives first"""
+    escaped = (re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(r'\b(' + '|'.join(escaped) + r')\b', re.IGNORECASE)
+
+# Precompiled keyword matchers: one linear scan per sentence instead of a
+# Python-level substring check per keyword
+_TONE_KEYWORDS = {kw.lower(): kw for kws in political_keywords.values() for kw in kws}
+_TONE_KEYWORD_RE = _compile_keyword_regex(_TONE_KEYWORDS)
+
+_PARTY_KEYWORDS = {kw.lower(): party for party, entity_data in political_entities.items()
+                   for kw in entity_data["keywords"]}
+_PARTY_KEYWORD_RE = _compile_keyword_regex(_PARTY_KEYWORDS)
+
+def sentence_tone_breakdown(text, sentences=None):
     """Analyze tone of individual sentences with political keyword detection"""
     try:
-        # Enhanced political keywords
-        political_keywords = {
-            "parties": ["BJP", "Congress", "AAP", "Aam Aadmi Party", "NDA", "UPA", "RSS"],
-            "leaders": ["Modi", "Narendra Modi", "Rahul Gandhi", "Arvind Kejriwal", "Sonia Gandhi"],
-            "terms": ["government", "opposition", "politics", "election", "democracy", "parliament"]
-        }
-        
-        # Split into sentences more accurately
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = split_sentences(text)
+
+        # Select the batch up front, then score it in one pass that
+        # tokenizes each sentence a single time
+        candidates = [s for s in sentences[:15] if len(s) >= 20]
         breakdown = []
-        
-        for sentence in sentences[:15]:  # Analyze first 15 sentences
-            sentence = sentence.strip()
-            if len(sentence) < 20:  # Skip very short sentences
-                continue
-                
+
+        for sentence in candidates:
             try:
-                blob = TextBlob(sentence)
-                polarity = blob.sentiment.polarity
-                subjectivity = blob.sentiment.subjectivity
-                
-                # Find political mentions
-                mentions = []
-                sentence_lower = sentence.lower()
-                
-                for category, keywords in political_keywords.items():
-                    for keyword in keywords:
-                        if keyword.lower() in sentence_lower:
-                            mentions.append(keyword)
-                
-                # Remove duplicates
-                mentions = list(set(mentions))
-                
+                tokens = _WORD_RE.findall(sentence.lower())
+                polarity = _sentence_polarity(sentence)
+                subjectivity = _subjectivity_from_tokens(tokens)
+
+                # Find political mentions in a single pass
+                mentions = list({_TONE_KEYWORDS[m.lower()] for m in _TONE_KEYWORD_RE.findall(sentence)})
+
                 breakdown.append({
                     "sentence": sentence,
                     "polarity": round(polarity, 3),
@@ -198,113 +404,105 @@ def sentence_tone_breakdown(text):
     except Exception as e:
         return []
 
+# Enhanced reliability database, keyed by registered domain (module-level
+# so it is built once, not reallocated per request)
+RELIABILITY_SCORES = {
+    # International News
+    "reuters.com": {"score": 92, "label": "Highly Reliable"},
+    "ap.org": {"score": 90, "label": "Highly Reliable"},
+    "bbc.com": {"score": 88, "label": "Highly Reliable"},
+    "npr.org": {"score": 87, "label": "Highly Reliable"},
+    "pbs.org": {"score": 86, "label": "Highly Reliable"},
+
+    # Indian News Sources
+    "thehindu.com": {"score": 85, "label": "Reliable"},
+    "indianexpress.com": {"score": 82, "label": "Reliable"},
+    "livemint.com": {"score": 80, "label": "Reliable"},
+    "business-standard.com": {"score": 79, "label": "Reliable"},
+    "scroll.in": {"score": 78, "label": "Reliable"},
+
+    # Major International
+    "cnn.com": {"score": 75, "label": "Generally Reliable"},
+    "nytimes.com": {"score": 83, "label": "Reliable"},
+    "washingtonpost.com": {"score": 81, "label": "Reliable"},
+    "theguardian.com": {"score": 80, "label": "Reliable"},
+
+    # Mixed/Lower Reliability
+    "foxnews.com": {"score": 65, "label": "Mixed Reliability"},
+    "ndtv.com": {"score": 72, "label": "Generally Reliable"},
+    "timesofindia.indiatimes.com": {"score": 70, "label": "Generally Reliable"},
+    "hindustantimes.com": {"score": 73, "label": "Generally Reliable"},
+    "india.com": {"score": 60, "label": "Mixed Reliability"},
+    "republicworld.com": {"score": 55, "label": "Mixed Reliability"},
+
+    # Questionable
+    "opindia.com": {"score": 45, "label": "Questionable"},
+    "altnews.in": {"score": 75, "label": "Generally Reliable"},
+}
+
+_UNKNOWN_SOURCE = {"score": "Unknown", "label": "Source Not Evaluated"}
+
 def get_source_reliability_score(url):
     """Enhanced source reliability scoring based on domain reputation"""
     try:
-        domain = urlparse(url).netloc.lower()
-        domain = domain.replace('www.', '')
-        
-        # Enhanced reliability database
-        reliability_scores = {
-            # International News
-            "reuters.com": {"score": 92, "label": "Highly Reliable"},
-            "ap.org": {"score": 90, "label": "Highly Reliable"},
-            "bbc.com": {"score": 88, "label": "Highly Reliable"},
-            "npr.org": {"score": 87, "label": "Highly Reliable"},
-            "pbs.org": {"score": 86, "label": "Highly Reliable"},
-            
-            # Indian News Sources
-            "thehindu.com": {"score": 85, "label": "Reliable"},
-            "indianexpress.com": {"score": 82, "label": "Reliable"},
-            "livemint.com": {"score": 80, "label": "Reliable"},
-            "business-standard.com": {"score": 79, "label": "Reliable"},
-            "scroll.in": {"score": 78, "label": "Reliable"},
-            
-            # Major International
-            "cnn.com": {"score": 75, "label": "Generally Reliable"},
-            "nytimes.com": {"score": 83, "label": "Reliable"},
-            "washingtonpost.com": {"score": 81, "label": "Reliable"},
-            "theguardian.com": {"score": 80, "label": "Reliable"},
-            
-            # Mixed/Lower Reliability
-            "foxnews.com": {"score": 65, "label": "Mixed Reliability"},
-            "ndtv.com": {"score": 72, "label": "Generally Reliable"},
-            "timesofindia.indiatimes.com": {"score": 70, "label": "Generally Reliable"},
-            "hindustantimes.com": {"score": 73, "label": "Generally Reliable"},
-            "india.com": {"score": 60, "label": "Mixed Reliability"},
-            "republicworld.com": {"score": 55, "label": "Mixed Reliability"},
-            
-            # Questionable
-            "opindia.com": {"score": 45, "label": "Questionable"},
-            "altnews.in": {"score": 75, "label": "Generally Reliable"},
-        }
-        
-        # Check for exact match first
-        if domain in reliability_scores:
-            return reliability_scores[domain]
-        
-        # Check for partial matches (subdomains)
-        for known_domain, score_info in reliability_scores.items():
-            if known_domain in domain or domain in known_domain:
-                return score_info
-        
-        # Default for unknown sources
-        return {"score": "Unknown", "label": "Source Not Evaluated"}
-        
+        domain = urlparse(url).netloc.lower().split(':')[0]
+
+        # Walk from the full host down to shorter suffixes so subdomains
+        # resolve via hash lookups ('m.bbc.com' -> 'bbc.com') without the
+        # old substring scan, which could also match unrelated hosts
+        labels = domain.split('.')
+        for i in range(len(labels) - 1):
+            suffix = '.'.join(labels[i:])
+            if suffix in RELIABILITY_SCORES:
+                return RELIABILITY_SCORES[suffix]
+
+        return _UNKNOWN_SOURCE
+
     except Exception as e:
         return {"score": "Unknown", "label": "Error in Assessment"}
 
-def detect_political_leaning(text):
+def detect_political_leaning(text, sentences=None):
     """Enhanced political sentiment analysis with more sophisticated detection"""
     try:
-        # Enhanced political entity mapping
-        political_entities = {
-            "BJP": {
-                "keywords": ["BJP", "Bharatiya Janata Party", "Modi", "Narendra Modi", "NDA", "RSS", "Amit Shah"],
-                "context_words": ["hindu", "nationalism", "development", "digital india"]
-            },
-            "Congress": {
-                "keywords": ["Congress", "Indian National Congress", "Rahul Gandhi", "Sonia Gandhi", "UPA", "Priyanka Gandhi"],
-                "context_words": ["secular", "inclusive", "welfare", "minority"]
-            },
-            "AAP": {
-                "keywords": ["AAP", "Aam Aadmi Party", "Arvind Kejriwal", "Manish Sisodia"],
-                "context_words": ["corruption", "common man", "education", "healthcare"]
-            }
-        }
-        
+        cache_key = ('leaning', _text_digest(text))
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if sentences is None:
+            sentences = split_sentences(text)
+
+        # Bucket sentences per mentioned party in one scan over the text
+        party_mentions = {}
+        for sentence in sentences:
+            parties = {_PARTY_KEYWORDS[m.lower()] for m in _PARTY_KEYWORD_RE.findall(sentence)}
+            for party in parties:
+                party_mentions.setdefault(party, []).append(sentence)
+
         results = {}
-        
-        for party, entity_data in political_entities.items():
-            party_sentences = []
-            
-            # Find sentences mentioning the party
-            for keyword in entity_data["keywords"]:
-                pattern = r'([^.!?]*\b' + re.escape(keyword) + r'\b[^.!?]*[.!?])'
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                party_sentences.extend(matches)
-            
+
+        for party, party_sentences in party_mentions.items():
             if party_sentences:
-                # Calculate sentiment for each sentence
+                # Calculate sentiment for each sentence via lexicon lookups
                 sentiments = []
                 for sentence in party_sentences:
                     try:
-                        blob = TextBlob(sentence)
-                        sentiment = blob.sentiment.polarity
-                        
+                        sentiment = _sentence_polarity(sentence)
+
                         # Weight by sentence length and relevance
                         words = len(sentence.split())
                         weight = min(1.0, words / 20)  # Longer sentences get more weight
-                        
+
                         sentiments.append(sentiment * weight)
                     except:
                         continue
-                
+
                 if sentiments:
                     avg_sentiment = sum(sentiments) / len(sentiments)
                     results[party] = round(avg_sentiment, 3)
-        
+
+        _ANALYSIS_CACHE.set(cache_key, results)
         return results
-        
+
     except Exception as e:
         return {}
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""WSGI entry point for running the API under gunicorn.
+
+Run with threaded workers so article-fetch I/O waits don't monopolize a
+worker (gthread rather than gevent - monkey-patching can break the C
+extensions used by lxml):
+
+    gunicorn -k gthread --workers 2 --threads 8 --timeout 30 wsgi:app
+"""
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _ROOT)
+sys.path.insert(0, os.path.join(_ROOT, 'netlify', 'functions'))
+
+from app import app  # noqa: E402